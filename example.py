@@ -7,47 +7,77 @@ demonstrating both sequential and parallel operations using tools and resources.
 
 import asyncio
 import os
+import httpx
 from mcp_agent import MCPAssistantAgent
+from llm_cache import LLMFileCache
 from autogen import ConversableAgent, UserProxyAgent
 
 
+class _SharedHttpClient(httpx.Client):
+    """HTTP client that is shared, not copied, when AutoGen deep-copies llm_config."""
+
+    def __deepcopy__(self, memo):
+        return self
+
+
 async def example():
     """Run an example interaction with an MCP-enabled AutoGen agent."""
 
     # Ensure data directory exists
     os.makedirs("./data", exist_ok=True)
 
-    # Configure the assistant
-    assistant = MCPAssistantAgent(
-        name="mcp_assistant",
-        system_message=_get_system_message(),
-        mcp_server_command="uv",
-        mcp_server_args=["run", "-m", "server.local_file_server"],
-        llm_config={
-            "config_list": [
-                {
-                    "model": "gpt-4o",
-                    "api_key": os.environ.get("OPENAI_API_KEY"),
-                }
-            ]
-        },
-        code_execution_config={"work_dir": "workspace", "use_docker": False},
-    )
-
-    # Configure the executor
-    executor = UserProxyAgent(
-        name="executor",
-        human_input_mode="NEVER",
-        code_execution_config={"work_dir": "data", "use_docker": False},
-        function_map={
-            "read_resource": assistant.read_resource,
-            "call_tool": assistant.call_tool,
-            "list_tools": assistant.list_tools,
-        },
-    )
-
-    # Run the example interaction
-    await executor.a_initiate_chat(assistant, message=_get_test_prompt(), max_turns=5)
+    # One HTTP connection pool shared by every LLM request, so each turn reuses the
+    # same keep-alive TLS connection
+    with _SharedHttpClient(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=60,
+    ) as http_client:
+        # Configure the assistant; entering it starts the MCP session pool used by tool calls
+        async with MCPAssistantAgent(
+            name="mcp_assistant",
+            system_message=_get_system_message(),
+            mcp_server_command="uv",
+            mcp_server_args=["run", "-m", "server.local_file_server"],
+            # Set to e.g. http://127.0.0.1:8000/sse to share one server started with
+            # --transport sse instead of spawning one per pooled session
+            mcp_server_url=os.environ.get("MCP_SERVER_URL"),
+            llm_config={
+                "config_list": [
+                    {
+                        "model": "gpt-4o",
+                        "api_key": os.environ.get("OPENAI_API_KEY"),
+                        "http_client": http_client,
+                    }
+                ],
+                # Deterministic sampling makes repeated runs cacheable
+                "temperature": 0,
+            },
+            code_execution_config={"work_dir": "workspace", "use_docker": False},
+        ) as assistant:
+            # Configure the executor
+            executor = UserProxyAgent(
+                name="executor",
+                human_input_mode="NEVER",
+                code_execution_config={"work_dir": "data", "use_docker": False},
+                function_map={
+                    "read_resource": assistant.read_resource,
+                    "call_tool": assistant.call_tool,
+                    "list_tools": assistant.list_tools,
+                    "read_resources": assistant.read_resources,
+                    "call_tools": assistant.call_tools,
+                },
+            )
+
+            # Cache LLM responses across runs; turns that call tools with side effects
+            # are never cached
+            cache = LLMFileCache(
+                ".cache/llm_cache.json", skip_tools={"call_tool", "call_tools"}
+            )
+
+            # Run the example interaction
+            await executor.a_initiate_chat(
+                assistant, message=_get_test_prompt(), max_turns=5, cache=cache
+            )
 
 
 def _get_system_message() -> str:
@@ -58,6 +88,7 @@ def _get_system_message() -> str:
     - Use read_resource for accessing file contents via URIs (e.g., "storage://local/config.txt")
     - Resources represent actual data and content you can read
     - Resource URIs follow the pattern: storage://local/{/path}
+    - Use read_resources with a list of URIs to read several resources in parallel
 
     Tools (for performing operations):
     - Discover available tools using list_tools
@@ -70,6 +101,8 @@ def _get_system_message() -> str:
     2. Then call_tool with:
         * name: The tool's name (e.g., "write_file")
         * args: An object matching the tool's parameter schema
+    3. To run several independent tool calls in parallel, use call_tools with a list
+        of objects, each with "name" and "args" as above
 
     Best Practices:
     1. Always discover tools first - don't assume which tools are available
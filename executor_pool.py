@@ -0,0 +1,186 @@
+"""
+Pooled MCP executors.
+
+This module provides a FIFO pool of ready MCP executors, each owning an initialized
+client session to an MCP server, either over stdio to a server subprocess of its
+own or over SSE to a shared server. Tool calls check an executor out, use its
+session and return it, instead of connecting and tearing down per request.
+
+Since an MCP server handles one request at a time per session, concurrent calls
+are spread across pooled executors rather than queued behind a single session.
+"""
+
+import asyncio
+import anyio
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Deque, Optional, Union
+from mcp.client.session import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client, StdioServerParameters
+
+# Server to connect to: parameters for spawning it over stdio, or an SSE endpoint URL
+MCPServer = Union[StdioServerParameters, str]
+
+# Errors meaning the executor's transport is gone, e.g. its server process died
+_TRANSPORT_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+)
+
+
+class MCPExecutor:
+    """An initialized client session to an MCP server.
+
+    The transport and session contexts are entered and exited by a dedicated task,
+    because anyio requires them to be closed by the task that opened them, while an
+    executor may be used (and shut down) from any task.
+
+    Attributes:
+        server (MCPServer): Server parameters to spawn over stdio, or an SSE URL
+        session (Optional[ClientSession]): The initialized session once started
+    """
+
+    def __init__(self, server: MCPServer):
+        self.server = server
+        self.session: Optional[ClientSession] = None
+        self._stopped = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> "MCPExecutor":
+        """Connect to the server and wait for the session to be initialized."""
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._serve(ready))
+        self.session = await ready
+        return self
+
+    @property
+    def alive(self) -> bool:
+        """Whether the executor's session task is still running."""
+        return self._task is not None and not self._task.done()
+
+    async def shutdown(self) -> None:
+        """Close the session, stopping the server process if spawned over stdio."""
+        self._stopped.set()
+        if self._task is not None:
+            await self._task
+
+    async def _serve(self, ready: asyncio.Future) -> None:
+        try:
+            if isinstance(self.server, str):
+                transport = sse_client(self.server)
+            else:
+                transport = stdio_client(self.server)
+            async with transport as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await self._stopped.wait()
+        except Exception as e:
+            if ready.done():
+                raise
+            ready.set_exception(e)
+
+
+class AsyncioExecutorPool:
+    """FIFO pool of ready MCP executors.
+
+    At most `max_size` executors exist at once; callers beyond that wait for one to
+    be released rather than starting more servers. Executors are created on demand
+    when none is idle and returned to the pool after use. With `reuse=False` the
+    pool runs in pass-through mode: every acquire starts a fresh executor and shuts
+    it down afterwards.
+
+    Attributes:
+        server (MCPServer): Server parameters to spawn over stdio, or an SSE URL
+    """
+
+    def __init__(
+        self,
+        server: MCPServer,
+        max_size: int = 4,
+        reuse: bool = True,
+    ):
+        """Initialize the pool.
+
+        Args:
+            server: Server parameters to spawn over stdio, or an SSE URL
+            max_size: Maximum number of executors alive (and calls in flight) at once
+            reuse: Whether executors are reused; False creates one per acquire
+        """
+        self.server = server
+        self._max_size = max_size
+        self._reuse = reuse
+        self._slots = asyncio.Semaphore(max_size)
+        self._idle: Deque[MCPExecutor] = deque()
+        self._closed = False
+
+    async def warm(self, count: Optional[int] = None) -> None:
+        """Start executors ahead of time so first requests don't pay startup cost.
+
+        Args:
+            count: Number of idle executors to have ready; defaults to max_size
+
+        Raises:
+            Exception: The first startup error; executors that did start are shut down
+        """
+        if not self._reuse:
+            return
+        count = min(count or self._max_size, self._max_size) - len(self._idle)
+        if count > 0:
+            results = await asyncio.gather(
+                *(MCPExecutor(self.server).start() for _ in range(count)),
+                return_exceptions=True,
+            )
+            errors = [r for r in results if isinstance(r, BaseException)]
+            executors = [r for r in results if not isinstance(r, BaseException)]
+            if errors:
+                # Don't leak the servers that did start
+                await asyncio.gather(*(self._discard(e) for e in executors))
+                raise errors[0]
+            self._idle.extend(executors)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ClientSession]:
+        """Check out an executor and yield its session, returning it afterwards.
+
+        Waits for a free executor when max_size of them are already in use.
+        """
+        async with self._slots:
+            # Checkout and release never await while touching the deque, so they
+            # are atomic on the event loop and need no lock.
+            executor = None
+            while self._idle and executor is None:
+                executor = self._idle.popleft()
+                if not executor.alive:
+                    await self._discard(executor)
+                    executor = None
+            if executor is None:
+                executor = await MCPExecutor(self.server).start()
+
+            broken = False
+            try:
+                yield executor.session
+            except _TRANSPORT_ERRORS:
+                broken = True
+                raise
+            finally:
+                if broken or not executor.alive:
+                    await self._discard(executor)
+                elif self._reuse and not self._closed:
+                    self._idle.append(executor)
+                else:
+                    await executor.shutdown()
+
+    async def close(self) -> None:
+        """Shut down all idle executors; executors in use shut down on release."""
+        self._closed = True
+        idle, self._idle = list(self._idle), deque()
+        await asyncio.gather(*(executor.shutdown() for executor in idle))
+
+    @staticmethod
+    async def _discard(executor: MCPExecutor) -> None:
+        # A dead executor's task may have ended with its transport error
+        with suppress(Exception):
+            await executor.shutdown()
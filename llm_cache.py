@@ -0,0 +1,128 @@
+"""
+File-backed LLM response cache.
+
+This module provides a JSON file cache implementing AutoGen's AbstractCache protocol,
+so repeated runs of a deterministic conversation are served from disk instead of
+re-querying the LLM.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+from openai.types.chat import ChatCompletion
+
+# Attributes AutoGen attaches to responses at runtime that must not be persisted
+_TRANSIENT_ATTRS = {"message_retrieval_function", "config_id", "pass_filter"}
+
+
+class LLMFileCache:
+    """JSON file cache for LLM completions, usable as an AutoGen `cache`.
+
+    Entries are keyed by the SHA-256 of AutoGen's request key (model, messages,
+    tools and other request parameters) and expire after `ttl` seconds. Only
+    deterministic requests (temperature 0) are cached, and responses that call a
+    tool in `skip_tools` are never stored, so operations with side effects are
+    always re-decided by the LLM.
+
+    Attributes:
+        path (Path): Location of the cache file
+        ttl (Optional[float]): Entry lifetime in seconds; None never expires
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = 24 * 60 * 60,
+        skip_tools: Iterable[str] = (),
+    ):
+        """Initialize the cache, loading any existing entries from disk.
+
+        Args:
+            path: Location of the cache file
+            ttl: Entry lifetime in seconds; None never expires
+            skip_tools: Names of tools whose calls must not be cached
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._skip_tools = frozenset(skip_tools)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            # A truncated or corrupt file is treated as an empty cache
+            try:
+                with open(self.path, "r") as f:
+                    entries = json.load(f)
+            except ValueError:
+                entries = {}
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
+        """Return the cached completion for a request key, or default."""
+        if not self._is_cacheable_request(key):
+            return default
+        entry = self._entries.get(self._hash(key))
+        if entry is None:
+            return default
+        if self._is_expired(entry, time.time()):
+            return default
+        return ChatCompletion.model_validate(entry["response"])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a completion for a request key and persist the cache file."""
+        if not self._is_cacheable_request(key) or not self._is_cacheable_response(value):
+            return
+        self._entries[self._hash(key)] = {
+            "created_at": time.time(),
+            "response": value.model_dump(mode="json", exclude=_TRANSIENT_ATTRS),
+        }
+        self._save()
+
+    def close(self) -> None:
+        """No-op; entries are written through on every set."""
+
+    def __enter__(self) -> "LLMFileCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def _hash(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _is_cacheable_request(key: str) -> bool:
+        # AutoGen's request key is the JSON-encoded request parameters
+        try:
+            return json.loads(key).get("temperature") == 0
+        except (ValueError, AttributeError):
+            return False
+
+    def _is_cacheable_response(self, value: Any) -> bool:
+        if not isinstance(value, ChatCompletion):
+            return False
+        for choice in value.choices:
+            for tool_call in choice.message.tool_calls or []:
+                if tool_call.function.name in self._skip_tools:
+                    return False
+        return True
+
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return self.ttl is not None and now - entry["created_at"] > self.ttl
+
+    def _save(self) -> None:
+        # Expired entries are dropped so the file doesn't grow without bound
+        now = time.time()
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if not self._is_expired(entry, now)
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self.path)
@@ -5,10 +5,34 @@ This module provides an extension of AutoGen's AssistantAgent that can interact
 MCP (Model Context Protocol) servers, enabling dynamic tool discovery and resource access.
 """
 
+import asyncio
 from autogen import AssistantAgent
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Dict, Optional, List, Any, Union
-from mcp.client.session import ClientSession
-from mcp.client.stdio import stdio_client, StdioServerParameters
+from mcp.client.stdio import StdioServerParameters
+from executor_pool import AsyncioExecutorPool
+
+
+# MCP executor pools of the agents whose `async with agent:` blocks are active, keyed
+# by id(agent) so nested blocks of different agents each keep their own server.
+# Tasks spawned inside a block (e.g. via asyncio.gather) inherit it automatically.
+_MCP_POOL_CV: ContextVar[Dict[int, AsyncioExecutorPool]] = ContextVar("mcp_pools")
+
+
+def get_mcp_pool(agent: "MCPAssistantAgent") -> AsyncioExecutorPool:
+    """Return the MCP executor pool an agent established for the current async context.
+
+    Args:
+        agent: The agent whose pool to return
+
+    Raises:
+        LookupError: If the agent's context is not active
+    """
+    try:
+        return _MCP_POOL_CV.get({})[id(agent)]
+    except KeyError:
+        raise LookupError(f"No MCP pool is active for agent {agent.name}") from None
 
 
 class MCPAssistantAgent(AssistantAgent):
@@ -19,17 +43,24 @@ class MCPAssistantAgent(AssistantAgent):
     - Access resources through the MCP protocol
     - Handle both synchronous and asynchronous operations
 
+    Use the agent as an async context manager to keep a pool of MCP sessions that
+    is reused by every tool call; outside of one, each call opens its own session.
+
     Attributes:
-        server_params (StdioServerParameters): Configuration for the MCP server connection
-        session (Optional[ClientSession]): Active MCP client session when connected
+        server_params (Optional[StdioServerParameters]): Configuration for spawning the
+            MCP server over stdio, when no server URL is given
+        server_url (Optional[str]): SSE endpoint of an already running MCP server
     """
 
     def __init__(
         self,
         name: str,
         system_message: str,
-        mcp_server_command: str,
+        mcp_server_command: Optional[str] = None,
         mcp_server_args: Optional[List[str]] = None,
+        mcp_server_url: Optional[str] = None,
+        mcp_pool_size: int = 4,
+        reuse_mcp_sessions: bool = True,
         **kwargs,
     ):
         """Initialize the MCP-enabled assistant agent.
@@ -37,14 +68,30 @@ class MCPAssistantAgent(AssistantAgent):
         Args:
             name: Name of the agent
             system_message: System message defining agent behavior
-            mcp_server_command: Command to start the MCP server
+            mcp_server_command: Command to start the MCP server over stdio
             mcp_server_args: Optional arguments for the MCP server
+            mcp_server_url: SSE endpoint (e.g. http://127.0.0.1:8000/sse) of a running
+                           MCP server to connect to instead of starting one
+            mcp_pool_size: Maximum number of MCP sessions open at once
+            reuse_mcp_sessions: Whether to pool MCP sessions; False opens and
+                               closes a session per call (previous behavior)
             **kwargs: Additional arguments passed to AssistantAgent
         """
+        if mcp_server_command is None and mcp_server_url is None:
+            raise ValueError("Either mcp_server_command or mcp_server_url is required")
+
         super().__init__(name=name, system_message=system_message, **kwargs)
-        self.server_params = StdioServerParameters(
-            command=mcp_server_command, args=mcp_server_args or []
-        )
+        self.server_url = mcp_server_url
+        self.server_params = None
+        if mcp_server_url is None:
+            self.server_params = StdioServerParameters(
+                command=mcp_server_command, args=mcp_server_args or []
+            )
+        self._mcp_server = mcp_server_url or self.server_params
+        self._mcp_pool_size = mcp_pool_size
+        self._reuse_mcp_sessions = reuse_mcp_sessions
+        self._passthrough_pool = AsyncioExecutorPool(self._mcp_server, reuse=False)
+        self._pool: Optional[AsyncioExecutorPool] = None
 
         @self.register_for_llm(description="Read content from a MCP resource")
         async def read_resource(uri: str) -> str:
@@ -60,10 +107,8 @@ class MCPAssistantAgent(AssistantAgent):
                 Exception: If reading the resource fails
             """
             try:
-                async with stdio_client(self.server_params) as (read, write):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-                        return await session.read_resource(uri)
+                async with self._session() as session:
+                    return await session.read_resource(uri)
             except Exception as e:
                 return f"Error reading resource: {str(e)}"
 
@@ -82,13 +127,11 @@ class MCPAssistantAgent(AssistantAgent):
                 Exception: If the tool call fails
             """
             try:
-                async with stdio_client(self.server_params) as (read, write):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-                        result = await session.call_tool(name, args)
-                        if not result:
-                            return {"status": "success"}
-                        return result
+                async with self._session() as session:
+                    result = await session.call_tool(name, args)
+                    if not result:
+                        return {"status": "success"}
+                    return result
             except Exception as e:
                 return f"Error calling tool: {str(e)}"
 
@@ -103,14 +146,80 @@ class MCPAssistantAgent(AssistantAgent):
                 Exception: If tool discovery fails
             """
             try:
-                async with stdio_client(self.server_params) as (read, write):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-                        return await session.list_tools()
+                async with self._session() as session:
+                    return await session.list_tools()
             except Exception as e:
                 print(f"Error listing tools: {e}")
                 raise
 
+        @self.register_for_llm(description="Read content from several MCP resources in parallel")
+        async def read_resources(uris: list[str]) -> list[str]:
+            """Read several MCP resources concurrently.
+
+            Args:
+                uris: The URIs of the resources (format: storage://local/path)
+
+            Returns:
+                list[str]: The content of each resource, in the order requested
+            """
+            return list(await asyncio.gather(*(read_resource(uri) for uri in uris)))
+
+        @self.register_for_llm(description="Call several tools in parallel")
+        async def call_tools(calls: list[dict[str, Any]]) -> list[Any]:
+            """Call several MCP tools concurrently.
+
+            Args:
+                calls: Tool calls, each an object with "name" and "args" keys
+
+            Returns:
+                list[Any]: The result of each tool call, in the order requested
+            """
+            return list(await asyncio.gather(*(_call_one(call) for call in calls)))
+
+        async def _call_one(call: Any) -> Any:
+            # Malformed items fail on their own instead of failing the whole batch
+            if not isinstance(call, dict) or "name" not in call:
+                return f"Error calling tool: expected an object with a \"name\" key, got {call!r}"
+            return await call_tool(call["name"], call.get("args", {}))
+
         self.read_resource = read_resource
         self.call_tool = call_tool
         self.list_tools = list_tools
+        self.read_resources = read_resources
+        self.call_tools = call_tools
+
+    async def __aenter__(self) -> "MCPAssistantAgent":
+        """Start the MCP executor pool shared by tool calls in this context.
+
+        Raises:
+            RuntimeError: If the agent's context is already active
+        """
+        if self._pool is not None:
+            raise RuntimeError(f"MCP context of agent {self.name} is already active")
+        # Claimed before the first await, so concurrent entries are rejected too
+        self._pool = pool = AsyncioExecutorPool(
+            self._mcp_server,
+            max_size=self._mcp_pool_size,
+            reuse=self._reuse_mcp_sessions,
+        )
+        try:
+            await pool.warm()
+        except BaseException:
+            self._pool = None
+            await pool.close()
+            raise
+        self._pool_token = _MCP_POOL_CV.set({**_MCP_POOL_CV.get({}), id(self): pool})
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Shut down the shared MCP executor pool."""
+        _MCP_POOL_CV.reset(self._pool_token)
+        pool, self._pool = self._pool, None
+        await pool.close()
+
+    @asynccontextmanager
+    async def _session(self):
+        """Yield an MCP session from the active pool, or a one-off session if none."""
+        pool = _MCP_POOL_CV.get({}).get(id(self), self._passthrough_pool)
+        async with pool.acquire() as session:
+            yield session
@@ -10,7 +10,11 @@ The server provides:
 """
 
 import os
+import stat
+import asyncio
 import logging
+from collections import OrderedDict
+from functools import wraps
 from pathlib import Path
 from typing import Optional, List
 from server.mcp_server import BaseMCPServer
@@ -24,12 +28,9 @@ from mcp.types import (
 from pydantic import AnyUrl, BaseModel, ValidationError
 from datetime import datetime
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by run(); importers keep their own configuration
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 class WriteFileParams(BaseModel):
     """Parameters for writing to a file"""
@@ -52,6 +53,132 @@ class WriteFileResponse(BaseModel):
     modified_at: datetime
 
 
+_URI_PREFIX = "storage://local/"
+
+# Listings are static, so build them (and the tool schema) once at import time
+# rather than on every list_* request.
+_WRITE_FILE_SCHEMA = WriteFileParams.model_json_schema()
+
+_TOOLS_LIST = [
+    Tool(
+        name="write_file",
+        description=(
+            "Write content to a file. Path is relative to server's "
+            "base directory."
+        ),
+        inputSchema=_WRITE_FILE_SCHEMA
+    )
+]
+
+_TOOL_MODELS = {
+    "write_file": WriteFileParams,
+}
+
+_RESOURCES_LIST = [
+    Resource(
+        uri=_URI_PREFIX,
+        name="Local Document Store",
+        description="A local document store",
+        mimeType="text/plain",
+    )
+]
+
+_RESOURCE_TEMPLATES_LIST = [
+    ResourceTemplate(
+        uriTemplate="storage://local/{/path}",
+        name="Local Document Store",
+        description="A local document store",
+        mimeType="text/plain",
+    )
+]
+
+
+# Files larger than this are read on every request instead of held in the cache
+_MAX_CACHED_SIZE = 1024 * 1024
+
+
+def _read_file(path_str: str) -> str | bytes:
+    """Read a file's content.
+
+    Content that is valid UTF-8 is decoded and returned as str (sent as text
+    contents); anything else is returned as raw bytes (sent as a blob).
+    """
+    with open(path_str, "rb") as f:
+        data = f.read()
+
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data
+
+
+# Contents of recently read files, keyed on (path, mtime_ns, size) and kept in LRU
+# order. A file that changes on disk gets a new key, so stale content is never
+# returned. Only touched from the event loop.
+_READ_CACHE_SIZE = 256
+_read_cache: OrderedDict[tuple[str, int, int], str | bytes] = OrderedDict()
+
+
+def _cache_get(key: tuple[str, int, int]) -> Optional[str | bytes]:
+    """Return cached content for a stat signature, or None on a miss."""
+    content = _read_cache.get(key)
+    if content is not None:
+        _read_cache.move_to_end(key)
+    return content
+
+
+def _cache_put(key: tuple[str, int, int], content: str | bytes) -> None:
+    """Cache content for a stat signature, evicting the least recently used entry."""
+    _read_cache[key] = content
+    _read_cache.move_to_end(key)
+    if len(_read_cache) > _READ_CACHE_SIZE:
+        _read_cache.popitem(last=False)
+
+
+def _write_text(path: Path, content: str) -> os.stat_result:
+    """Write content to a file and return its resulting stat.
+
+    The file is created/truncated in the open call and stat'ed through the
+    still-open descriptor, avoiding a second path lookup.
+    """
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+        return os.fstat(fd)
+    finally:
+        os.close(fd)
+
+
+def _mcp_safe(server: BaseMCPServer):
+    """Decorate a tool handler so that any error is returned as error content.
+
+    Errors caused by the request itself (invalid arguments, unknown tools, paths
+    outside the base directory) are logged without a traceback; only unexpected
+    exceptions are logged with one.
+
+    Args:
+        server: Server whose format_error is used for failed calls
+    """
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(name: str, arguments: dict | None) -> list[TextContent]:
+            try:
+                return await handler(name, arguments)
+            except ValidationError as e:
+                logger.error("Validation error for tool %s: %s", name, e)
+                return [server.format_error(e)]
+            except ValueError as e:
+                logger.error("Error executing tool %s: %s", name, e)
+                return [server.format_error(e)]
+            except Exception as e:
+                logger.error("Error executing tool %s: %s", name, e, exc_info=True)
+                return [server.format_error(e)]
+        return wrapper
+    return decorator
+
+
 class LocalFileServer(BaseMCPServer):
     """MCP server implementation for local file system operations.
     
@@ -69,17 +196,19 @@ class LocalFileServer(BaseMCPServer):
         """
         try:
             self.base_path = Path(base_path or os.getcwd()).resolve()
+            # Base directory with a trailing separator, for lexical containment checks
+            self._base_str = os.path.join(str(self.base_path), "")
             if not self.base_path.exists():
                 self.base_path.mkdir(parents=True)
-                logger.info(f"Created base directory: {self.base_path}")
+                logger.info("Created base directory: %s", self.base_path)
 
             super().__init__("local-file-server")
-            logger.info(f"LocalFileServer initialized with base path: {self.base_path}")
+            logger.info("LocalFileServer initialized with base path: %s", self.base_path)
 
             # Register handlers during initialization
             self._register_handlers()
         except Exception as e:
-            logger.error(f"Failed to initialize LocalFileServer: {e}")
+            logger.error("Failed to initialize LocalFileServer: %s", e)
             raise
 
     def _register_handlers(self):
@@ -89,80 +218,64 @@ class LocalFileServer(BaseMCPServer):
             @self._server.list_resources()
             async def handle_list_resources():
                 """List available resources in the file system."""
-                return [
-                    Resource(
-                    uri="storage://local/",
-                    name="Local Document Store",
-                    description="A local document store",
-                    mimeType="text/plain",
-                    )
-                ]
+                return _RESOURCES_LIST
 
             @self._server.list_resource_templates()
             async def handle_list_resource_templates():
                 """List available resource templates."""
-                return [
-                    ResourceTemplate(
-                        uriTemplate="storage://local/{/path}",
-                        name="Local Document Store",
-                        description="A local document store",
-                        mimeType="text/plain",
-                        )
-                ]
+                return _RESOURCE_TEMPLATES_LIST
 
             @self._server.read_resource()
-            async def handle_read_resource(uri: str) -> str:
+            async def handle_read_resource(uri: str) -> str | bytes:
                 """Read a resource from the file system.
                 
                 Args:
                     uri: URI of the resource to read (format: storage://local/path)
                 
                 Returns:
-                    str: Content of the resource
+                    str | bytes: Content of the resource; bytes for non-text files
                 
                 Raises:
                     FileNotFoundError: If the resource doesn't exist
-                    ValueError: If the URI is invalid
+                    ValueError: If the URI is invalid or does not name a file
                 """
                 try:
                     uri_str = str(uri)
-                    if not uri_str.startswith("storage://local/"):
+                    if not uri_str.startswith(_URI_PREFIX):
                         raise ValueError(f"Invalid URI format: {uri}")
 
-                    path = uri_str.split("storage://local/")[1]
-                    full_path = (self.base_path / path).resolve()
-
-                    # Security check - ensure path is within base_path
-                    if not str(full_path).startswith(str(self.base_path)):
-                        raise ValueError(f"Access denied: Path {path} is outside base directory")
+                    path = uri_str[len(_URI_PREFIX):]
+                    full_path = self._resolve_path(path)
 
-                    if not full_path.exists():
+                    try:
+                        st = full_path.stat()
+                    except FileNotFoundError:
                         raise FileNotFoundError(f"Resource not found: {path}")
-
-                    with open(full_path, "r") as f:
-                        content = f.read()
-                        logger.debug(f"Successfully read resource: {path}")
-                        return content
+                    if not stat.S_ISREG(st.st_mode):
+                        raise ValueError(f"Resource is not a file: {path}")
+
+                    # Hits are answered on the event loop; only misses read the file,
+                    # in a worker thread so the loop isn't blocked
+                    key = (str(full_path), st.st_mtime_ns, st.st_size)
+                    content = _cache_get(key)
+                    if content is None:
+                        content = await asyncio.to_thread(_read_file, key[0])
+                        if st.st_size <= _MAX_CACHED_SIZE:
+                            _cache_put(key, content)
+                    logger.debug("Successfully read resource: %s", path)
+                    return content
                 except Exception as e:
-                    logger.error(f"Error reading resource {uri}: {e}")
+                    logger.error("Error reading resource %s: %s", uri, e)
                     raise
 
             # Tool handlers
             @self._server.list_tools()
             async def handle_list_tools():
                 """List available tools for file operations."""
-                return [
-                    Tool(
-                        name="write_file",
-                        description=(
-                            "Write content to a file. Path is relative to server's "
-                            "base directory."
-                        ),
-                        inputSchema=WriteFileParams.model_json_schema()
-                    )
-                ]
+                return _TOOLS_LIST
 
             @self._server.call_tool()
+            @_mcp_safe(self)
             async def handle_call_tool(
                 name: str, 
                 arguments: dict | None
@@ -176,50 +289,57 @@ class LocalFileServer(BaseMCPServer):
                 Returns:
                     list[TextContent]: Tool execution results
                 """
-                try:
-                    tool_handlers = {
-                        "write_file": self._write_file,
-                    }
-
-                    if name not in tool_handlers:
-                        raise ValueError(f"Unknown tool: {name}")
+                if name not in _TOOL_HANDLERS:
+                    raise ValueError(f"Unknown tool: {name}")
 
-                    handler = tool_handlers[name]
-                    model_map = {
-                        "write_file": WriteFileParams,
-                    }
-
-                    input_model = model_map[name]
-                    try:
-                        validated_args = input_model.model_validate(arguments or {})
-                    except ValidationError as e:
-                        logger.error(f"Validation error for tool {name}: {e}")
-                        return [self.format_error(e)]
-
-                    try:
-                        result = await handler(validated_args)
-                        logger.info(f"Successfully executed tool {name}")
-                        return [self.format_response(result)]
-                    except Exception as e:
-                        logger.error(f"Error executing tool {name}: {e}")
-                        return [self.format_error(e)]
-
-                except Exception as e:
-                    logger.error(f"Unexpected error in tool handler: {e}")
-                    return [self.format_error(e)]
+                validated_args = _TOOL_MODELS[name].model_validate(arguments or {})
+                result = await _TOOL_HANDLERS[name](self, validated_args)
+                logger.info("Successfully executed tool %s", name)
+                return [self.format_response(result)]
 
             logger.info("Successfully registered all MCP handlers")
         except Exception as e:
-            logger.error(f"Failed to register handlers: {e}")
+            logger.error("Failed to register handlers: %s", e)
             raise
 
+    def _resolve_path(self, path: str) -> Path:
+        """Resolve a client-supplied path relative to base_path.
+
+        The path is normalized lexically instead of with Path.resolve(), which
+        stats every component from the filesystem root. Only the components below
+        base_path are checked for symlinks, and the path is resolved on disk only
+        when one is found.
+
+        Raises:
+            ValueError: If the path is outside base_path
+        """
+        candidate = os.path.normpath(os.path.join(self._base_str, path))
+        # normpath drops the trailing separator, so base itself ("" or ".") is
+        # not prefixed by _base_str
+        if candidate == str(self.base_path):
+            return self.base_path
+
+        # Security check - ensure path is within base_path
+        if not candidate.startswith(self._base_str):
+            raise ValueError(f"Access denied: Path {path} is outside base directory")
+
+        probe = self._base_str
+        for part in candidate[len(self._base_str):].split(os.sep):
+            probe = os.path.join(probe, part)
+            if os.path.islink(probe):
+                full_path = Path(candidate).resolve()
+                if not full_path.is_relative_to(self.base_path):
+                    raise ValueError(f"Access denied: Path {path} is outside base directory")
+                return full_path
+        return Path(candidate)
+
     async def _write_file(self, params: WriteFileParams) -> WriteFileResponse:
         """Write content to a file"""
-        full_path = self.base_path / params.path
+        full_path = self._resolve_path(params.path)
         try:
-            with open(full_path, "w") as f:
-                f.write(params.content)
-            stats = full_path.stat()
+            stats = await asyncio.to_thread(_write_text, full_path, params.content)
+            # Writes must never be served from the read cache
+            _read_cache.clear()
             return WriteFileResponse(
                 path=params.path,
                 bytes_written=stats.st_size,
@@ -229,11 +349,45 @@ class LocalFileServer(BaseMCPServer):
             raise RuntimeError(f"Failed to write file: {e}")
 
 
+_TOOL_HANDLERS = {
+    "write_file": LocalFileServer._write_file,
+}
+
+
+def _sse_app(local_server: LocalFileServer):
+    """Build an ASGI app serving an MCP server over SSE.
+
+    Clients open a session's event stream with GET /sse and POST their messages
+    to the /messages endpoint announced on that stream.
+    """
+    from mcp.server.sse import SseServerTransport
+    from starlette.responses import PlainTextResponse
+
+    sse = SseServerTransport("/messages")
+
+    async def app(scope, receive, send):
+        path = scope.get("path")
+        if scope["type"] == "http" and path == "/sse":
+            async with sse.connect_sse(scope, receive, send) as streams:
+                await local_server._server.run(
+                    streams[0],
+                    streams[1],
+                    local_server._server.create_initialization_options()
+                )
+        elif scope["type"] == "http" and path == "/messages":
+            await sse.handle_post_message(scope, receive, send)
+        else:
+            await PlainTextResponse("Not Found", status_code=404)(scope, receive, send)
+
+    return app
+
+
 async def run():
-    """Run the MCP server using stdio transport.
+    """Run the MCP server using stdio or SSE transport.
     
     This function initializes and runs the server, handling command-line arguments
-    and setting up the stdio communication channel.
+    and setting up the stdio communication channel, or an HTTP server that many
+    clients can share when using SSE.
     """
     import argparse
     from mcp.server.stdio import stdio_server
@@ -252,15 +406,52 @@ async def run():
         default="INFO",
         help="Set the logging level (default: INFO)"
     )
+    parser.add_argument(
+        "--transport",
+        type=str,
+        choices=["stdio", "sse"],
+        default="stdio",
+        help="Transport to serve on (default: stdio)"
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="Host to bind when using SSE transport (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port to bind when using SSE transport (default: 8000)"
+    )
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     # Update log level if specified
     logger.setLevel(getattr(logging, args.log_level))
     
     try:
-        logger.info(f"Starting LocalFileServer with path: {args.path}")
+        logger.info("Starting LocalFileServer with path: %s", args.path)
         local_server = LocalFileServer(args.path)
-        
+
+        if args.transport == "sse":
+            import uvicorn
+
+            config = uvicorn.Config(
+                _sse_app(local_server),
+                host=args.host,
+                port=args.port,
+                lifespan="off",
+                log_level=args.log_level.lower(),
+            )
+            logger.info("Server started on http://%s:%s/sse", args.host, args.port)
+            await uvicorn.Server(config).serve()
+            return
+
         async with stdio_server() as streams:
             logger.info("Server started, waiting for connections...")
             await local_server._server.run(
@@ -271,14 +462,13 @@ async def run():
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         raise
 
 
 if __name__ == "__main__":
-    import asyncio
     try: 
         asyncio.run(run())
     except Exception as e:
-        logger.critical(f"Fatal server error: {e}")
+        logger.critical("Fatal server error: %s", e)
         raise
@@ -28,9 +28,11 @@ class BaseMCPServer:
 
     def format_response(self, response: BaseModel) -> TextContent:
         """Format a Pydantic model response as TextContent"""
+        # model_dump_json already runs in pydantic-core's native encoder; going
+        # through model_dump() for a third-party encoder such as orjson is slower
         return TextContent(
             type="text",
-            text=response.model_dump_json(indent=2)
+            text=response.model_dump_json()
         )
 
     def format_error(self, error: Exception) -> TextContent:
@@ -0,0 +1,39 @@
+"""Shared fixtures."""
+
+import asyncio
+import pytest
+import executor_pool
+
+
+class FakeExecutor:
+    """Stands in for MCPExecutor without starting a server."""
+
+    def __init__(self, server, created):
+        self.server = server
+        self.session = self
+        self.alive = False
+        self.shut_down = False
+        created.append(self)
+
+    async def start(self):
+        await asyncio.sleep(0)
+        self.alive = True
+        return self
+
+    async def shutdown(self):
+        self.alive = False
+        self.shut_down = True
+
+    # Session methods; the fake is its own session
+    async def call_tool(self, name, arguments):
+        return f"called {name} with {arguments}"
+
+
+@pytest.fixture
+def executors(monkeypatch):
+    """Replace MCPExecutor with FakeExecutor; yields the executors created."""
+    created = []
+    monkeypatch.setattr(
+        executor_pool, "MCPExecutor", lambda server: FakeExecutor(server, created)
+    )
+    return created
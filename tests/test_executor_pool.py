@@ -0,0 +1,116 @@
+"""Tests for AsyncioExecutorPool checkout and release."""
+
+import asyncio
+import anyio
+import pytest
+import executor_pool
+from executor_pool import AsyncioExecutorPool
+
+
+def test_concurrent_checkouts_never_exceed_max_size(executors):
+    in_use = 0
+    peak = 0
+
+    async def call(pool):
+        nonlocal in_use, peak
+        async with pool.acquire():
+            in_use += 1
+            peak = max(peak, in_use)
+            await asyncio.sleep(0.01)
+            in_use -= 1
+
+    async def main():
+        pool = AsyncioExecutorPool("server", max_size=3)
+        await asyncio.gather(*(call(pool) for _ in range(20)))
+        await pool.close()
+
+    asyncio.run(main())
+    assert peak == 3
+    assert len(executors) == 3
+
+
+def test_released_executors_are_reused(executors):
+    async def main():
+        pool = AsyncioExecutorPool("server", max_size=2)
+        await pool.warm()
+        sessions = []
+        for _ in range(5):
+            async with pool.acquire() as session:
+                sessions.append(session)
+        await pool.close()
+        return sessions
+
+    sessions = asyncio.run(main())
+    assert len(executors) == 2
+    # FIFO: executors are handed out in turn
+    assert sessions == [executors[i % 2] for i in range(5)]
+    assert all(executor.shut_down for executor in executors)
+
+
+def test_warm_fills_pool_to_max_size_once(executors):
+    async def main():
+        pool = AsyncioExecutorPool("server", max_size=4)
+        await pool.warm()
+        await pool.warm()
+        await pool.close()
+
+    asyncio.run(main())
+    assert len(executors) == 4
+
+
+def test_dead_executors_are_discarded(executors):
+    async def main():
+        pool = AsyncioExecutorPool("server", max_size=2)
+        await pool.warm(1)
+        executors[0].alive = False
+        async with pool.acquire() as session:
+            assert session is executors[1]
+
+        with pytest.raises(anyio.ClosedResourceError):
+            async with pool.acquire():
+                raise anyio.ClosedResourceError
+        async with pool.acquire() as session:
+            assert session is executors[2]
+        await pool.close()
+
+    asyncio.run(main())
+    assert executors[0].shut_down
+    assert executors[1].shut_down
+
+
+def test_pass_through_mode_shuts_down_after_each_call(executors):
+    async def main():
+        pool = AsyncioExecutorPool("server", reuse=False)
+        await pool.warm()
+        for _ in range(3):
+            async with pool.acquire():
+                pass
+
+    asyncio.run(main())
+    assert len(executors) == 3
+    assert all(executor.shut_down for executor in executors)
+
+
+
+def test_failed_warm_shuts_down_started_executors(executors, monkeypatch):
+    fake = executor_pool.MCPExecutor
+
+    def flaky(server):
+        executor = fake(server)
+        if len(executors) == 2:
+            async def fail():
+                raise OSError("server failed to start")
+            executor.start = fail
+        return executor
+
+    monkeypatch.setattr(executor_pool, "MCPExecutor", flaky)
+
+    async def main():
+        pool = AsyncioExecutorPool("server", max_size=3)
+        with pytest.raises(OSError, match="failed to start"):
+            await pool.warm()
+        assert not pool._idle
+
+    asyncio.run(main())
+    assert len(executors) == 3
+    assert executors[0].shut_down and executors[2].shut_down
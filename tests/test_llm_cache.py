@@ -0,0 +1,119 @@
+"""Tests for LLMFileCache."""
+
+import json
+import pytest
+from autogen.oai.openai_utils import get_key
+from openai.types.chat import ChatCompletion
+from llm_cache import LLMFileCache
+
+
+def _request(temperature=0, content="hello"):
+    return get_key(
+        {
+            "model": "gpt-4",
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": content}],
+        }
+    )
+
+
+def _completion(tool_name=None):
+    message = {"role": "assistant", "content": None if tool_name else "hi"}
+    if tool_name:
+        message["tool_calls"] = [
+            {
+                "id": "call_1",
+                "type": "function",
+                "function": {"name": tool_name, "arguments": "{}"},
+            }
+        ]
+    return ChatCompletion.model_validate(
+        {
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "tool_calls" if tool_name else "stop",
+                    "message": message,
+                }
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "cache" / "llm_cache.json"
+
+
+def test_round_trip_through_file(path):
+    response = _completion()
+    # AutoGen attaches runtime attributes that must not be persisted
+    response.config_id = 0
+    LLMFileCache(str(path)).set(_request(), response)
+
+    cached = LLMFileCache(str(path)).get(_request())
+    assert isinstance(cached, ChatCompletion)
+    assert cached.choices[0].message.content == "hi"
+    assert "config_id" not in json.dumps(json.loads(path.read_text()))
+
+
+def test_only_temperature_zero_requests_are_cached(path):
+    cache = LLMFileCache(str(path))
+    cache.set(_request(temperature=0.7), _completion())
+    assert cache.get(_request(temperature=0.7)) is None
+    assert not path.exists()
+
+    cache.set(_request(temperature=0), _completion())
+    assert cache.get(_request(temperature=0)) is not None
+
+
+def test_unparseable_key_is_not_cached(path):
+    cache = LLMFileCache(str(path))
+    cache.set("not json", _completion())
+    assert cache.get("not json", "default") == "default"
+
+
+def test_skip_tools_responses_are_not_cached(path):
+    cache = LLMFileCache(str(path), skip_tools={"call_tool"})
+    cache.set(_request(content="write"), _completion("call_tool"))
+    assert cache.get(_request(content="write")) is None
+
+    cache.set(_request(content="read"), _completion("read_resource"))
+    assert cache.get(_request(content="read")) is not None
+
+
+def test_expired_entries_are_missed_and_pruned(path, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr("llm_cache.time.time", lambda: now)
+    cache = LLMFileCache(str(path), ttl=60)
+    cache.set(_request(content="old"), _completion())
+
+    now += 61
+    assert cache.get(_request(content="old")) is None
+    cache.set(_request(content="new"), _completion())
+    assert len(json.loads(path.read_text())) == 1
+    assert cache.get(_request(content="new")) is not None
+
+
+def test_no_ttl_never_expires(path, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr("llm_cache.time.time", lambda: now)
+    cache = LLMFileCache(str(path), ttl=None)
+    cache.set(_request(), _completion())
+    now += 10 * 365 * 24 * 60 * 60
+    assert cache.get(_request()) is not None
+
+
+@pytest.mark.parametrize("contents", ['{"truncated": ', "not json", "[]"])
+def test_corrupt_file_is_an_empty_cache(path, contents):
+    path.parent.mkdir(parents=True)
+    path.write_text(contents)
+    cache = LLMFileCache(str(path))
+    assert cache.get(_request()) is None
+
+    cache.set(_request(), _completion())
+    assert LLMFileCache(str(path)).get(_request()) is not None
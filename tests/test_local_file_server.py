@@ -0,0 +1,156 @@
+"""Tests for LocalFileServer path resolution and resource reads."""
+
+import asyncio
+import base64
+import os
+import pytest
+from mcp.types import ReadResourceRequest
+from server import local_file_server
+from server.local_file_server import LocalFileServer
+
+
+@pytest.fixture
+def base(tmp_path):
+    base = tmp_path / "data"
+    (base / "sub").mkdir(parents=True)
+    (base / "sub" / "file.txt").write_text("inside")
+    # base_path is resolved, so compare against the resolved location
+    return base.resolve()
+
+
+@pytest.fixture
+def server(base):
+    return LocalFileServer(str(base))
+
+
+def test_relative_path_inside_base(server, base):
+    assert server._resolve_path("sub/file.txt") == base / "sub" / "file.txt"
+    assert server._resolve_path("sub/../sub/file.txt") == base / "sub" / "file.txt"
+
+
+@pytest.mark.parametrize("path", ["", ".", "sub/.."])
+def test_base_itself_is_inside_base(server, base, path):
+    assert server._resolve_path(path) == base
+
+
+@pytest.mark.parametrize("path", ["../x.txt", "sub/../../x.txt", "../../../etc/passwd"])
+def test_parent_traversal_is_denied(server, path):
+    with pytest.raises(ValueError, match="Access denied"):
+        server._resolve_path(path)
+
+
+def test_absolute_path_outside_base_is_denied(server, tmp_path):
+    with pytest.raises(ValueError, match="Access denied"):
+        server._resolve_path("/etc/passwd")
+    with pytest.raises(ValueError, match="Access denied"):
+        server._resolve_path(str(tmp_path / "x.txt"))
+
+
+def test_absolute_path_inside_base_is_allowed(server, base):
+    path = str(base / "sub" / "file.txt")
+    assert server._resolve_path(path) == base / "sub" / "file.txt"
+
+
+def test_sibling_directory_sharing_prefix_is_denied(server, tmp_path):
+    # /.../data2 starts with the string /.../data but is not inside it
+    (tmp_path / "data2").mkdir()
+    (tmp_path / "data2" / "secret.txt").write_text("outside")
+    with pytest.raises(ValueError, match="Access denied"):
+        server._resolve_path("../data2/secret.txt")
+    with pytest.raises(ValueError, match="Access denied"):
+        server._resolve_path(str(tmp_path / "data2" / "secret.txt"))
+
+
+def test_symlinked_directory_outside_base_is_denied(server, base, tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret.txt").write_text("outside")
+    os.symlink(outside, base / "link")
+    with pytest.raises(ValueError, match="Access denied"):
+        server._resolve_path("link/secret.txt")
+    with pytest.raises(ValueError, match="Access denied"):
+        server._resolve_path("link")
+
+
+def test_symlinked_file_outside_base_is_denied(server, base, tmp_path):
+    (tmp_path / "secret.txt").write_text("outside")
+    os.symlink(tmp_path / "secret.txt", base / "secret.txt")
+    with pytest.raises(ValueError, match="Access denied"):
+        server._resolve_path("secret.txt")
+
+
+def test_symlink_inside_base_is_resolved(server, base):
+    os.symlink(base / "sub", base / "alias")
+    assert server._resolve_path("alias/file.txt") == base / "sub" / "file.txt"
+
+
+def test_dangling_symlink_outside_base_is_denied(server, base, tmp_path):
+    os.symlink(tmp_path / "missing.txt", base / "dangling.txt")
+    with pytest.raises(ValueError, match="Access denied"):
+        server._resolve_path("dangling.txt")
+
+
+def test_dangling_symlink_inside_base_resolves_to_target(server, base):
+    os.symlink(base / "missing.txt", base / "dangling.txt")
+    resolved = server._resolve_path("dangling.txt")
+    assert resolved == base / "missing.txt"
+    assert not resolved.exists()
+
+
+def _read(server, path):
+    handler = server._server.request_handlers[ReadResourceRequest]
+    request = ReadResourceRequest(
+        method="resources/read", params={"uri": f"storage://local/{path}"}
+    )
+    result = asyncio.run(handler(request))
+    return result.root.contents[0]
+
+
+@pytest.fixture
+def file_reads(monkeypatch):
+    """Count the reads that reach the file system."""
+    local_file_server._read_cache.clear()
+    reads = []
+    read_file = local_file_server._read_file
+
+    def counting_read(path_str):
+        reads.append(path_str)
+        return read_file(path_str)
+
+    monkeypatch.setattr(local_file_server, "_read_file", counting_read)
+    return reads
+
+
+def test_repeated_reads_are_served_from_cache(server, file_reads):
+    assert _read(server, "sub/file.txt").text == "inside"
+    assert _read(server, "sub/file.txt").text == "inside"
+    assert len(file_reads) == 1
+
+
+def test_modified_file_is_reread(server, base, file_reads):
+    assert _read(server, "sub/file.txt").text == "inside"
+    (base / "sub" / "file.txt").write_text("changed")
+    assert _read(server, "sub/file.txt").text == "changed"
+    assert len(file_reads) == 2
+
+
+def test_large_files_are_not_cached(server, base, file_reads, monkeypatch):
+    monkeypatch.setattr(local_file_server, "_MAX_CACHED_SIZE", 4)
+    _read(server, "sub/file.txt")
+    _read(server, "sub/file.txt")
+    assert len(file_reads) == 2
+    assert not local_file_server._read_cache
+
+
+def test_binary_file_is_read_as_blob(server, base, file_reads):
+    (base / "image.bin").write_bytes(b"\xff\xd8\xff")
+    blob = _read(server, "image.bin").blob
+    # MCP 1.1 encodes blobs with the URL-safe alphabet
+    assert base64.urlsafe_b64decode(blob) == b"\xff\xd8\xff"
+
+
+@pytest.mark.parametrize("path", ["", "sub"])
+def test_reading_a_directory_is_not_a_file(server, file_reads, path):
+    with pytest.raises(ValueError, match="not a file"):
+        _read(server, path)
+    assert not file_reads
@@ -0,0 +1,102 @@
+"""Tests for MCPAssistantAgent's MCP context."""
+
+import asyncio
+import pytest
+from mcp_agent import MCPAssistantAgent, get_mcp_pool
+
+_LLM_CONFIG = {"config_list": [{"model": "gpt-4", "api_key": "test"}]}
+
+
+def _agent(name: str = "agent") -> MCPAssistantAgent:
+    return MCPAssistantAgent(
+        name, "test", mcp_server_url="http://127.0.0.1:8000/sse", llm_config=_LLM_CONFIG
+    )
+
+
+def test_context_sets_and_clears_pool(executors):
+    agent = _agent()
+
+    async def main():
+        async with agent:
+            assert get_mcp_pool(agent)
+        with pytest.raises(LookupError):
+            get_mcp_pool(agent)
+
+    asyncio.run(main())
+    assert executors and all(executor.shut_down for executor in executors)
+
+
+def test_nested_reentry_is_rejected(executors):
+    agent = _agent()
+
+    async def main():
+        async with agent:
+            pool = get_mcp_pool(agent)
+            with pytest.raises(RuntimeError, match="already active"):
+                async with agent:
+                    pass
+            assert get_mcp_pool(agent) is pool
+
+    asyncio.run(main())
+    assert all(executor.shut_down for executor in executors)
+
+
+def test_concurrent_reentry_is_rejected(executors):
+    agent = _agent()
+
+    async def block():
+        async with agent:
+            await asyncio.sleep(0.01)
+
+    async def main():
+        results = await asyncio.gather(block(), block(), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, RuntimeError)]
+        assert len(errors) == 1
+
+    asyncio.run(main())
+    assert all(executor.shut_down for executor in executors)
+
+
+def test_agent_can_be_reentered_after_exit(executors):
+    agent = _agent()
+
+    async def main():
+        async with agent:
+            pass
+        async with agent:
+            pass
+
+    asyncio.run(main())
+    assert all(executor.shut_down for executor in executors)
+
+
+def test_different_agents_keep_their_own_pools(executors):
+    a, b = _agent("a"), _agent("b")
+
+    async def main():
+        async with a:
+            async with b:
+                assert get_mcp_pool(a) is not get_mcp_pool(b)
+            assert get_mcp_pool(a)
+
+    asyncio.run(main())
+
+
+def test_call_tools_keeps_malformed_items_to_themselves(executors):
+    agent = _agent()
+    calls = [
+        {"name": "write_file", "args": {"path": "a.txt"}},
+        {"args": {"path": "b.txt"}},
+        "write_file",
+        {"name": "write_file"},
+    ]
+
+    async def main():
+        async with agent:
+            return await agent.call_tools(calls)
+
+    results = asyncio.run(main())
+    assert results[0] == "called write_file with {'path': 'a.txt'}"
+    assert results[1].startswith("Error calling tool:")
+    assert results[2].startswith("Error calling tool:")
+    assert results[3] == "called write_file with {}"